@@ -3,29 +3,48 @@ from tides import Tides
 from astro import Astro
 from cal_draw import generate_annual_calendar
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 import os
 
-parser = argparse.ArgumentParser()
-parser.add_argument('filename',
-                    help = 'Path to a NOAA annual tide tables text file.')
-args = parser.parse_args()
 
-if not os.path.isfile(args.filename):
-    raise IOError('Cannot find {}'.format(args.filename))
-print('Making Sun * Moon * Tide Calendar with input file \
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('filename',
+                        help = 'Path to a NOAA annual tide tables text file.')
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.filename):
+        raise IOError('Cannot find {}'.format(args.filename))
+    print('Making Sun * Moon * Tide Calendar with input file \
 {}.'.format(args.filename))
 
-tides = Tides(args.filename)
-print('{}, {}'.format(tides.station_name, tides.state))
-sun = Astro(str(tides.latitude), str(tides.longitude),
-            tides.timezone, tides.year, 'Sun')
-print('Sun calculations complete.')
-moon = Astro(str(tides.latitude), str(tides.longitude),
-             tides.timezone, tides.year, 'Moon')
-print('Moon calculations complete.')
-
-print('Starting to draw calendar now.')
-output_filename = 'SunMoonTide_{}_{}.pdf'.format(tides.year, tides.station_id)
-generate_annual_calendar(tides, sun, moon, output_filename)
-print('Calendar complete. Find output `{}` in the current working \
+    tides = Tides(args.filename)
+    print('{}, {}'.format(tides.station_name, tides.state))
+    # parse location/year once at the boundary; Astro takes numbers
+    latitude = float(tides.latitude)
+    longitude = float(tides.longitude)
+    year = int(tides.year)
+
+    # Sun and Moon calculations are independent, so run them in parallel
+    with ProcessPoolExecutor(max_workers = 2) as executor:
+        sun_future = executor.submit(Astro, latitude, longitude,
+                                     tides.timezone, year, 'Sun')
+        moon_future = executor.submit(Astro, latitude, longitude,
+                                      tides.timezone, year, 'Moon')
+        sun = sun_future.result()
+        print('Sun calculations complete.')
+        moon = moon_future.result()
+    print('Moon calculations complete.')
+
+    print('Starting to draw calendar now.')
+    output_filename = 'SunMoonTide_{}_{}.pdf'.format(tides.year,
+                                                     tides.station_id)
+    generate_annual_calendar(tides, sun, moon, output_filename)
+    print('Calendar complete. Find output `{}` in the current working \
 directory.'.format(output_filename))
+
+
+# worker processes re-import this module under spawn/forkserver start
+# methods, so the script body must only run in the real main process
+if __name__ == '__main__':
+    main()
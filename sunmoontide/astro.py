@@ -6,8 +6,11 @@ lunar phases (if Astro object is named 'Moon') and solar equinoxes/solstices
 be useful in other applications.
 """
 
+import copy
 import datetime
 import ephem
+import functools
+import math
 import numpy as np
 import pandas as pd
 import pytz
@@ -27,8 +30,14 @@ def round_datetime(dt):
 
 def copy_ephem_observer(original_observer):
     """ephem.Observer objects are missing a copy method. So this returns a
-    brand new Observer object whose attributes have been set to the same values
-    as in the original observer."""
+    brand new Observer object. Uses copy.copy where the Observer supports
+    the copy protocol; otherwise falls back to setting each attribute to the
+    same value as in the original observer (each assignment goes through
+    pyephem's angle-coercing setters, so the single copy.copy is cheaper)."""
+    try:
+        return copy.copy(original_observer)
+    except TypeError:
+        pass
     new_observer = ephem.Observer()
     new_observer.date = original_observer.date
     new_observer.epoch = original_observer.epoch
@@ -41,6 +50,7 @@ def copy_ephem_observer(original_observer):
     return new_observer
 
 
+@functools.lru_cache(maxsize=32)
 def utc_year_bounds(time_zone, year):
     """Given a tzdata/IANA time zone name (string) and a year (can be a string
     or integer), returns two ephem.Date objects corresponding to local midnight
@@ -67,43 +77,27 @@ def utc_year_bounds(time_zone, year):
     """
     begin = datetime.datetime(int(year), 1, 1)
     end = datetime.datetime(int(year), 12, 31, 23, 59, 59)
+    tz = pytz.timezone(time_zone)
     # make no assumptions about timezone offsets, even for similar day of year
-    begin_raw_offset = pytz.timezone(time_zone).localize(begin).strftime('%z')
-    end_raw_offset = pytz.timezone(time_zone).localize(end).strftime('%z')
-    # raw offsets are strings of the form '+HHMM' or '-HHMM'; H=hour, M=minute
-
-    def _parse_UTC_offset(raw_offset: str):
-        """arg must be a UTC offset of the form '+HHMM' or '-HHMM'; H = hour,
-        M = minute. returns (float) number of days offset, Boolean indicating
-        whether offset is ahead (False) or behind (True) UTC.
-        """
-        assert(len(raw_offset) == 5) #valid raw UTC offsets are '+HHMM'/'-HHMM' 
-        if raw_offset[0] == '+':
-            behind = False
-        elif raw_offset[0] == '-':
-            behind = True
-        else:
-            raise ValueError('raw timezone offsets are not in expected format')
-        hour = int(raw_offset[1:3])
-        minute = int(raw_offset[3:])
-        days = (hour + (minute / 60)) / 24
-        return days, behind
-    
-    def _make_offset_ephemDates(date_time, days, behind):
-        """arg types: datetime.datetime, float, Boolean. return type: ephem.Date"""
-        if behind:
-            return ephem.Date(ephem.Date(date_time) + days)
-        else:
-            return ephem.Date(ephem.Date(date_time) - days)
-    
-    begin_days, begin_behind = _parse_UTC_offset(begin_raw_offset)
-    begin_result = _make_offset_ephemDates(begin, begin_days, begin_behind)
-    end_days, end_behind = _parse_UTC_offset(end_raw_offset)
-    end_result = _make_offset_ephemDates(end, end_days, end_behind)
-    
+    # utcoffset is positive east of UTC, so subtract it to get UTC
+    begin_days = tz.utcoffset(begin).total_seconds() / 86400.0
+    end_days = tz.utcoffset(end).total_seconds() / 86400.0
+    begin_result = ephem.Date(ephem.Date(begin) - begin_days)
+    end_result = ephem.Date(ephem.Date(end) - end_days)
     return begin_result, end_result
 
 
+@functools.lru_cache(maxsize=8)
+def _season_events(year):
+    """Return the (spring equinox, summer solstice, fall equinox, winter
+    solstice) ephem.Dates for `year` (a string). Cached so the four
+    transcendental-event solves run once per year, not once per Astro."""
+    return (ephem.next_spring_equinox(year),
+            ephem.next_summer_solstice(year),
+            ephem.next_fall_equinox(year),
+            ephem.next_winter_solstice(year))
+
+
 def fill_in_heights(start, stop, step, observe, body_name, append_NaN = True):
     """Return sequential lists of times and heights between start and stop
     times, at given time step, for an astronomical body's altitude over time.
@@ -113,8 +107,9 @@ def fill_in_heights(start, stop, step, observe, body_name, append_NaN = True):
         stop (ephem.Date): the final time (included in the result)
         step (float): a step size in days (i.e. 15 minutes - `15 * ephem.minute`)
         observe (ephem.Observer): pre-initialized ephem.Observer() object
-            with location information set; it will be copied to prevent
-            alteration of the original observer object
+            with location information set; only its date is touched during
+            the sweep, and that is restored before returning, so the
+            caller's observer comes back unaltered
         body_name (str): a title-case ephem body name, i.e. 'Sun' or 'Moon'
         
     Optional:
@@ -124,11 +119,12 @@ def fill_in_heights(start, stop, step, observe, body_name, append_NaN = True):
     
     Returns:
         times, heights
-        times: a list of sequential timezone-naive datetime.datetimes (in UTC)
-        heights: a list of floats, providing sin(altitude) of the body at
-            each time
+        times: a numpy datetime64[us] array of sequential timezone-naive
+            times (in UTC)
+        heights: a numpy float array, providing the altitude of the body at
+            each time (in radians)
         len(times) == len(heights)
-        
+
     Example:
     >>> cruz = ephem.Observer()
     >>> cruz.lat, cruz.lon = '36.97', '-122.02'
@@ -137,7 +133,7 @@ def fill_in_heights(start, stop, step, observe, body_name, append_NaN = True):
     >>> ti, he = fill_in_heights(time1, time2, 15 * ephem.minute, cruz, 'Sun')
     >>> for t,h in zip(ti, he):
     ...     print('{0} ... {1:7.3f}'.format(
-    ...                    round_datetime(t).strftime('%Y-%m-%d %H:%M'),
+    ...                    round_datetime(t.astype(datetime.datetime)).strftime('%Y-%m-%d %H:%M'),
     ...                    np.sin(h)))
     ... 
     2015-05-15 19:00 ...   0.921
@@ -147,33 +143,73 @@ def fill_in_heights(start, stop, step, observe, body_name, append_NaN = True):
     2015-05-15 20:00 ...   0.951
     2015-05-15 20:00 ...     nan
     """
-    times = []
-    heights = []
-    obs = copy_ephem_observer(observe)
-    obs.date = start
-    body = eval('ephem.' + body_name + '(obs)')
-    
-    while round(obs.date, 6) < round(stop, 6):
-        times.append(obs.date.datetime())
-        body.compute(obs) # compute new body position for the new observer time
-        height_now = body.alt # altitude angle (in radians)
-        heights.append(height_now)
-        obs.date += step # observer moves forward one time step
-        
-    obs.date = stop  # observer moves to exact stopping time
-    times.append(obs.date.datetime())
-    body.compute(obs)
-    height_now = body.alt
-    heights.append(height_now)
-                
-    if append_NaN:
-        times.append(ephem.Date(obs.date + step/100).datetime())
-        heights.append(float('NaN'))
-    
-    assert(len(times) == len(heights))        
-    return times, heights
+    # the date is the only observer attribute this sweep mutates, so save
+    # and restore it rather than allocating and copying a whole Observer
+    obs = observe
+    saved_date = obs.date
+    try:
+        obs.date = start
+        body = getattr(ephem, body_name)(obs)
+
+        # number of whole steps strictly before `stop`, computed once -
+        # replaces rounding and comparing two ephem.Date floats on every
+        # iteration
+        n_steps = int(math.ceil(round((stop - start) / step, 6)))
+
+        # preallocate output arrays - appending tens of thousands of boxed
+        # floats/datetimes to Python lists causes repeated reallocation
+        times = np.empty(n_steps + 2, dtype = 'datetime64[us]')
+        # float32 is far more precision than the plots can resolve, and
+        # halves the memory footprint of the year-long series
+        heights = np.empty(n_steps + 2, dtype = np.float32)
+
+        # the sample times are uniform, so generate them in one vectorized
+        # shot instead of converting ephem's Julian date to a datetime
+        # every tick
+        step_us = np.timedelta64(int(round(step * 86400 * 1e6)), 'us')
+        times[:n_steps] = (np.datetime64(ephem.Date(start).datetime())
+                           + np.arange(n_steps) * step_us)
+
+        # hoist bound method out of the loop - tens of thousands of
+        # iterations
+        compute = body.compute
+        for i in range(n_steps):
+            # absolute stepping from `start` avoids accumulated float drift
+            obs.date = start + i * step
+            compute(obs) # compute new body position for the new time
+            heights[i] = body.alt # altitude angle (in radians)
+
+        obs.date = stop  # observer moves to exact stopping time
+        times[n_steps] = obs.date.datetime()
+        compute(obs)
+        heights[n_steps] = body.alt
+        i = n_steps + 1
+
+        if append_NaN:
+            times[i] = ephem.Date(stop + step/100).datetime()
+            heights[i] = float('NaN')
+            i += 1
+    finally:
+        obs.date = saved_date  # hand the observer back unchanged, even if
+                               # a compute call raised mid-sweep
+
+    # both arrays are trimmed to the same fill count, so the lengths cannot
+    # disagree; pd.Series would also raise on any mismatch downstream
+    return times[:i], heights[:i]
     
     
+@functools.lru_cache(maxsize=64)
+def _lunation_anchors(last_new):
+    """Return the quarter-phase boundaries (next new, first quarter, full,
+    last quarter moons, all ephem.Dates) for the lunation beginning at
+    `last_new`. ephem.Date is a float subclass, so caching on it shares the
+    four root-finder solves among every day in the same lunation."""
+    return (ephem.next_new_moon(last_new),
+            ephem.next_first_quarter_moon(last_new),
+            ephem.next_full_moon(last_new),
+            ephem.next_last_quarter_moon(last_new))
+
+
 def get_lunation_day(today, number_of_phase_ids=28):
     '''Given a date (of type ephem.Date), return a lunar cycle day ID number
     (integer in [0:(number_of_phase_ids - 1)]), corresponding to the lunation
@@ -195,21 +231,18 @@ def get_lunation_day(today, number_of_phase_ids=28):
     calculated by pyephem, but it does not always agree exactly with
     percent illumination, which is a different calculation entirely.'''
     last_new = ephem.previous_new_moon(today)
-    next_new = ephem.next_new_moon(today)
+    next_new, next_fq, next_full, next_lq = _lunation_anchors(last_new)
     num = number_of_phase_ids - 1
     first_approx = round((today - last_new) / (next_new - last_new) * num)
     if first_approx < np.ceil(num / 4):
-        next_fq = ephem.next_first_quarter_moon(last_new)
         if today < next_fq:
             return round((today - last_new) / (next_fq - last_new)
                         * (num / 4))
     if first_approx < np.ceil(num / 2):
-        next_full = ephem.next_full_moon(last_new)
         if today < next_full:
             return round((today - last_new) / (next_full - last_new)
                         * (num / 2))
     if first_approx < np.ceil(num * 3 / 4):
-        next_lq = ephem.next_last_quarter_moon(last_new)
         if today < next_lq:
             return round((today - last_new) / (next_lq - last_new)
                         * (num * 3 / 4))
@@ -223,29 +256,32 @@ class Astro:
     Purpose is to calculate and then store the various input required to graph
     sun, moon, or other astronomical body for a Sun * Moon * Tide calendar.
     """
-    def __init__(self, latitude: str, longitude: str, timezone: str, year: str,
-                 name: str):
+    def __init__(self, latitude: float, longitude: float, timezone: str,
+                 year: int, name: str):
         """Take the all necessary location/year/body name information and
         construct plot-ready astronomical body time series for calendar.
         Attributes are all set and ready for queries/plotting after __init__.
-        
+
         Arguments:
-        latitude = latitude in decimal degrees as a string, i.e. '36.9577'
-        longitude = longitude in decimal degrees as a string, i.e. '-122.0402'
+        latitude = latitude in decimal degrees, i.e. 36.9577
+        longitude = longitude in decimal degrees, i.e. -122.0402
         timezone = tzdata/IANA time zone as a string, i.e. 'America/Los_Angeles'
-        year = the year desired for the calendar, as a string, i.e. '2016'
+        year = the year desired for the calendar, i.e. 2016
         name = the name of the astronomical body as a string, first letter
                capitalized, i.e. 'Sun' or 'Moon'
+
+        The caller parses any string input (e.g. from the NOAA file) once at
+        the boundary; numbers are not re-parsed here.
         """
         self.latitude = latitude
         self.longitude = longitude
         self.timezone = timezone
         self.year = year
         self.name = name
-        
+
         observer = ephem.Observer()
-        observer.lat = ephem.degrees(latitude)
-        observer.long = ephem.degrees(longitude)
+        observer.lat = latitude * ephem.degree
+        observer.long = longitude * ephem.degree
         observer.elevation = 0
         begin, end = utc_year_bounds(timezone, year)
         step = 10 * ephem.minute #resolution of full timeseries of body heights
@@ -254,49 +290,39 @@ class Astro:
                                              observer, name, append_NaN=False)        
         '''Convert to pandas timeseries and localize the time index.'''
         assert(len(allheights) == len(alltimes))
-        hei = pd.Series(allheights, alltimes)
-        hei.index = hei.index.tz_localize('UTC')
-        hei.index = hei.index.tz_convert(timezone)
-        self.altitudes = hei
+        # build the tz-aware index in one construction instead of rebuilding
+        # the 52k-entry index twice via tz_localize + tz_convert assignment
+        index = pd.DatetimeIndex(alltimes, tz = 'UTC').tz_convert(timezone)
+        self.altitudes = pd.Series(allheights, index)
 
 # ----------------- Special attributes for Sun and Moon ----------------
 
         '''Equinox and solstice events for Sun'''
         if name == 'Sun':
-            spring = ephem.next_spring_equinox(year)
-            summer = ephem.next_summer_solstice(year)
-            fall = ephem.next_fall_equinox(year)
-            winter = ephem.next_winter_solstice(year)
+            spring, summer, fall, winter = _season_events(str(year))
             event_times = [spring.datetime(), summer.datetime(), 
                            fall.datetime(), winter.datetime()]
             event_names = ['spring equinox', 'summer solstice', 'fall equinox',
                            'winter solstice']
-            events = pd.Series(event_names, event_times)
-            events.index = events.index.tz_localize('UTC')
-            events.index = events.index.tz_convert(timezone)
-            self.events = events
+            event_index = pd.DatetimeIndex(event_times,
+                                           tz = 'UTC').tz_convert(timezone)
+            self.events = pd.Series(event_names, event_index)
 
         '''Daily phase (% illuminated, 28-day icon ID) for Moon'''
         if name == 'Moon':
             moon = ephem.Moon()
             illuminated = []
+            cycle_days = []
             observer.date = begin + 22 * ephem.hour  # 10 pm local time Jan 1
             moon.compute(observer)
             while observer.date < end:
                 illuminated.append(moon.moon_phase)
+                cycle_days.append(get_lunation_day(observer.date))
                 observer.date += 1
                 moon.compute(observer)
-            daily_times = pd.date_range(year + '-01-01', year + '-12-31', 
-                                      tz = timezone)
-            assert(len(illuminated) == len(daily_times))
+            daily_times = pd.date_range('{}-01-01'.format(year),
+                                      '{}-12-31'.format(year), tz = timezone)
             self.percent_illuminated = pd.Series(illuminated, daily_times)
-            
-            cycle_days = []            
-            moon_day = begin + 22 * ephem.hour   # 10 pm local time Jan 1
-            while moon_day < end:
-                    cycle_days.append(get_lunation_day(moon_day))
-                    moon_day += 1
-            assert(len(cycle_days) == len(daily_times))
             self.phase_day_num = pd.Series(cycle_days, daily_times)
             
             exact_names = []
@@ -316,10 +342,9 @@ class Astro:
                 exact_times.append(next_full.datetime())
                 exact_names.append('full')
                 nowdate = next_full
-            half_phases = pd.Series(exact_names, exact_times)
-            half_phases.index = half_phases.index.tz_localize('UTC')
-            half_phases.index = half_phases.index.tz_convert(timezone)
-            self.half_phases = half_phases
+            half_index = pd.DatetimeIndex(exact_times,
+                                          tz = 'UTC').tz_convert(timezone)
+            self.half_phases = pd.Series(exact_names, half_index)
 
 
 if __name__ == "__main__":
@@ -6,46 +6,96 @@ useful in other applications.
 """
 import matplotlib
 matplotlib.use('PDF')
-from matplotlib.backends.backend_pdf import PdfPages
+# vector-output tuning: path simplification drops redundant co-linear
+# vertices from the dense fill_between outlines at draw time, and maximum
+# pdf compression shrinks the embedded page streams
+matplotlib.rcParams.update({'path.simplify': True,
+                            'path.simplify_threshold': 1.0,
+                            'agg.path.chunksize': 10000,
+                            'pdf.compression': 9})
+from matplotlib.backends.backend_pdf import FigureCanvasPdf
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
 import matplotlib.gridspec as gridspec
-import matplotlib.pyplot as plt
-plt.ioff()
 
 import calendar
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
 from PIL import Image
 import pkgutil
-from PyPDF2 import PdfFileMerger, PdfFileReader
 from io import BytesIO
 import os
 
 import cal_pages
 
+# shared font properties for the text drawn in the plot loops; passing a
+# bare family name makes every text call build and resolve a fresh
+# FontProperties (Text copies these, so sharing is safe)
+_FONT_ALEGREYA = FontProperties(family = 'Alegreya')
+_FONT_MOON = FontProperties(family = 'moon phases')
+
+# the full lunar cycle in the 'moon phases' font, indexed by phase day
+# number (dark-part glyphs; '@' is full, '0' is new)
+_MOON_ICONS = '0ABCDEFGHIJKLM@NOPQRSTUVWXYZ'
+
+# facecolors for the three stacked sun/moon fills on each daily subplot:
+# sunlight intensity, sun altitude angle, moon altitude angle
+_DAY_FILL_COLORS = [to_rgba('#FFEB00', 0.25),
+                    to_rgba('#FFEB00', 1.0),
+                    to_rgba('#D7A8A8', 0.25)]
+
+# facecolors for the solstice/equinox icons, keyed by Astro event name
+_SUN_ICON_COL = {
+    'spring equinox':   '#CCFFCC',
+    'summer solstice':  '#E2AAFF',
+    'fall equinox':     '#D56F28',
+    'winter solstice':  '#B4EAF4'
+}
+
+
+def _load_logo():
+    """Decode the cruzviz footer logo into an RGBA float array. Called once
+    at import so every month page shares the decoded pixels; returns None if
+    the image cannot be loaded.
+    """
+    try:
+        logo = pkgutil.get_data('cal_draw', 'graphics/logo.png')
+        im = np.asarray(Image.open(BytesIO(logo)), dtype = np.float32)
+        im *= 1.0 / 255.0  # scale in place; no second full-size temporary
+        return im
+    except Exception as e:
+        print('Could not load logo image. Error: {}'.format(e))
+        return None
+
+_LOGO = _load_logo()
+
+
+def _events_by_month(events):
+    """Index an Astro events Series (the solstices and equinoxes) by month
+    number. There is at most one such event in any month.
+    """
+    return {ts.month: (ts, name) for ts, name in events.items()}
+
 
 def days_in_month(year_month_string):
-    """Generator that takes year_month_string (e.g. '2015-07') and yields
+    """Takes year_month_string (e.g. '2015-07') and returns a list of
     all the days of the month in order, also as strings (e.g. '2015-07-18').
     """
     start_date = pd.to_datetime(year_month_string)
     _, days_in_month = calendar.monthrange(start_date.year, start_date.month)
-    end_date = start_date + pd.DateOffset(days_in_month)
-    current_date = start_date
-    while current_date < end_date:
-        yield current_date.strftime('%Y-%m-%d')
-        current_date = current_date + pd.DateOffset()
+    days = pd.date_range(start_date, periods = days_in_month, freq = 'D')
+    return days.strftime('%Y-%m-%d').tolist()
 
 
 def months_in_year(year_string):
-    """Generator that takes year_string (e.g. '2015') and yields all the months
+    """Takes year_string (e.g. '2015') and returns a list of all the months
     of the year in order, also as strings (e.g. '2015-07').
     """
-    start_date = pd.to_datetime(year_string + '-01')    
-    end_date = start_date + pd.DateOffset(months = 12)
-    current_date = start_date
-    while current_date < end_date:
-        yield current_date.strftime('%Y-%m')
-        current_date = current_date + pd.DateOffset(months = 1)
+    months = pd.date_range(year_string + '-01', periods = 12, freq = 'MS')
+    return months.strftime('%Y-%m').tolist()
         
 
 def date_before(year_month_day_string):
@@ -67,6 +117,18 @@ def date_after(year_month_day_string):
 
 
 
+def _month_page_pdf(args):
+    """Worker for generate_annual_calendar: render one month page and return
+    it as PDF bytes (month, tide, sun, moon objects pickle across processes;
+    live Figures do not, so each worker saves its own).
+    """
+    month, tide_o, sun_o, moon_o = args
+    monthfig = month_page(month, tide_o, sun_o, moon_o)
+    buffer = BytesIO()
+    monthfig.savefig(buffer, format='pdf')
+    return buffer.getvalue()
+
+
 def generate_annual_calendar(tide_obj, sun_obj, moon_obj, file_name):
     '''Take tide, sun, and moon objects and generate a PDF file named
     `file_name`, which is a complete annual Sun * Moon * Tide calendar. File is
@@ -80,20 +142,32 @@ def generate_annual_calendar(tide_obj, sun_obj, moon_obj, file_name):
     file_name: string. ".pdf" will NOT be appended to the file_name so the .pdf
                 extension ought to be included in file_name.
     '''
-    with PdfPages('temp.pdf') as pdf_out:
-        coverfig = cover(tide_obj)
-        coverfig.savefig(pdf_out, format='pdf')
-        print('Calendar cover saved.')
-        yearviewfig = yearview(tide_obj, sun_obj, moon_obj)
-        print('{} Overview created, now saving...'.format(tide_obj.year))
-        yearviewfig.savefig(pdf_out, format='pdf')
-        print('{} Overview saved.'.format(tide_obj.year))
-
-        for month in months_in_year(tide_obj.year):
-            monthfig = month_page(month, tide_obj, sun_obj, moon_obj)
-            print('{} figure created, now saving...'.format(month))
-            monthfig.savefig(pdf_out, format='pdf')
-            print('Saved {}'.format(month))
+    # deferred: only the final merge needs PyPDF2, and importing it at
+    # module load would tax helpers like days_in_month and every worker
+    from PyPDF2 import PdfFileMerger, PdfFileReader
+
+
+    # cover and overview go straight into in-memory buffers; writing them
+    # through a temp.pdf on disk just to re-read it for the merge below
+    # costs two needless trips through the filesystem
+    coverfig = cover(tide_obj)
+    cover_buf = BytesIO()
+    coverfig.savefig(cover_buf, format='pdf')
+    print('Calendar cover saved.')
+    yearviewfig = yearview(tide_obj, sun_obj, moon_obj)
+    print('{} Overview created, now saving...'.format(tide_obj.year))
+    yearview_buf = BytesIO()
+    yearviewfig.savefig(yearview_buf, format='pdf')
+    print('{} Overview saved.'.format(tide_obj.year))
+
+    # the twelve month pages are independent, so render them in parallel
+    months = months_in_year(tide_obj.year)
+    jobs = [(month, tide_obj, sun_obj, moon_obj) for month in months]
+    workers = min(len(months), os.cpu_count() or 1)
+    print('Drawing month figures on {} processes...'.format(workers))
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        month_pdfs = list(executor.map(_month_page_pdf, jobs))
+    print('All month figures created.')
 
     d = {}
     d['/Title'] = 'Sun * Moon * Tide {} Calendar'.format(tide_obj.year)
@@ -103,23 +177,19 @@ def generate_annual_calendar(tide_obj, sun_obj, moon_obj, file_name):
     
     print('Merging front and back matter into calendar... \
 (ignore PdfReadWarnings)')    
-    about_pdf = cal_pages.about('{}, {}'.format(tide_obj.station_name,
-                                                    tide_obj.state))
-    tech_pdf = cal_pages.tech(tide_obj)
-    merger = PdfFileMerger(strict = False)    
-    with open('temp.pdf','rb') as cal:
-        merger.append(PdfFileReader(cal))
-    with open(about_pdf,'rb') as about:
-        merger.merge(1, PdfFileReader(about))
-    with open(tech_pdf,'rb') as tech:
-        merger.append(PdfFileReader(tech))
+    about_bytes = cal_pages.about('{}, {}'.format(tide_obj.station_name,
+                                                      tide_obj.state))
+    tech_bytes = cal_pages.tech(tide_obj)
+    merger = PdfFileMerger(strict = False)
+    merger.append(PdfFileReader(cover_buf))
+    merger.append(PdfFileReader(BytesIO(about_bytes)))
+    merger.append(PdfFileReader(yearview_buf))
+    for month, month_pdf in zip(months, month_pdfs):
+        merger.append(PdfFileReader(BytesIO(month_pdf)))
+        print('Added {} to calendar.'.format(month))
+    merger.append(PdfFileReader(BytesIO(tech_bytes)))
     merger.addMetadata(d)
     merger.write(file_name)
-                
-    print('Cleaning up temporary files...')
-    os.remove('temp.pdf')
-    os.remove(about_pdf)
-    os.remove(tech_pdf)
     
     
 def month_page(month_string, tide_o, sun_o, moon_o):
@@ -133,81 +203,133 @@ def month_page(month_string, tide_o, sun_o, moon_o):
         moon_o: astro.Astro object for 'Moon'
     
     Returns:
-        fig: matplotlib.pyplot Figure object, ready for writing to PDF.
+        fig: matplotlib Figure object, ready for writing to PDF.
     '''
-    fig = plt.figure(figsize=(8.5,11))
+    fig = Figure(figsize = (8.5, 11))
+    FigureCanvasPdf(fig)
     
     # some renaming of things for readability
     tide_min, tide_max = tide_o.annual_min, tide_o.annual_max
     place_name = tide_o.station_name + ", " + tide_o.state
-    month_title = pd.to_datetime(month_string).strftime('%B')
+    month_title = calendar.month_name[int(month_string[5:7])]
     year_title = tide_o.year
 
+    # precompute the integer slice position of each local midnight once per
+    # month - partial-string indexing re-parses the date string and searches
+    # the full-year index three times for every day otherwise
+    month_days = days_in_month(month_string)
+    day_edges = pd.date_range(month_days[0], periods = len(month_days) + 1,
+                              freq = 'D', tz = tide_o.timezone)
+    sun_pos = sun_o.altitudes.index.searchsorted(day_edges)
+    moon_pos = moon_o.altitudes.index.searchsorted(day_edges)
+    tide_pos = tide_o.all_tides.index.searchsorted(day_edges)
+    # plot x-limits, converted to matplotlib date number format in one
+    # vectorized call rather than two scalar tz-localize + date2num per day
+    edge_nums = matplotlib.dates.date2num(day_edges.to_pydatetime())
+    # convert each series' timestamps once per month; to_pydatetime
+    # allocates an object per element, and the overlapping daily slices
+    # would otherwise convert most samples twice over
+    if month_days[0][5:] == '01-01':  # day one slices from the series start
+        sun_base = moon_base = tide_base = 0
+    else:
+        sun_base = sun_pos[0] - 10
+        moon_base = moon_pos[0] - 10
+        tide_base = tide_pos[0] - 10
+    # end of the month window per series: ten samples into next month,
+    # clipped to the series length - shared by the x-array slicing below
+    # and the Dec-31 stops in _plot_a_date so x and y stay consistent
+    sun_end = min(len(sun_o.altitudes), sun_pos[-1] + 11)
+    moon_end = min(len(moon_o.altitudes), moon_pos[-1] + 11)
+    tide_end = min(len(tide_o.all_tides), tide_pos[-1] + 11)
+    # x-coordinates go all the way to matplotlib date numbers in one
+    # vectorized conversion per series (the daily plots take raw floats)
+    sun_x = matplotlib.dates.date2num(sun_o.altitudes.index[
+                                  sun_base:sun_end].to_pydatetime())
+    moon_x = matplotlib.dates.date2num(moon_o.altitudes.index[
+                                  moon_base:moon_end].to_pydatetime())
+    tide_x = matplotlib.dates.date2num(tide_o.all_tides.index[
+                                  tide_base:tide_end].to_pydatetime())
+    # evaluate the plotted transforms once per month as plain arrays -
+    # np.sin and the altitude normalization over the overlapping daily
+    # Series slices would recompute most samples twice over
+    sun_vals = sun_o.altitudes.values[sun_base:sun_end]
+    sun_sin = np.sin(sun_vals)
+    sun_norm = sun_vals / (np.pi / 2)
+    moon_norm = moon_o.altitudes.values[moon_base:moon_end] / (np.pi / 2)
+    tide_vals = tide_o.all_tides.values
+    # phase day numbers for the month in one label lookup, so the daily
+    # loop indexes a plain integer array instead of the pandas Series
+    phase_nums = moon_o.phase_day_num[month_string].values
+
 #------------------ daily plot creator function -------------------
-    def _plot_a_date(grid_index, date):
+    def _plot_a_date(grid_index, day_index, date):
         '''Internal function. Works on pre-defined gridspec gs and assumes
-        variables like tide_min, tide_max, month_of_tide/moon/sun already
+        variables like tide_min, tide_max, sun_pos/moon_pos/tide_pos already
         defined in outer scope.
-        
+
         Plots the two daily subplots for `date` in gridspec coordinates
         gs[grid_index] for the sun/moon and gs[grid_index + 7] for tide.
-        `date` must be a string in %Y-%m-%d format, i.e. '2015-07-18'.
-        
+        `day_index` is the zero-based day of the month; `date` must be a
+        string in %Y-%m-%d format, i.e. '2015-07-18'.
+
         Returns ax1, ax2 = sun/moon (ax1) and tide (ax2) subplot handles
         '''
         # need to extend the slices into neighboring dates to ensure smoothness
         # (unless it is the first or last day of the year!)
-        yesterday = date_before(date)
-        tomorrow = date_after(date)
-
         if date[5:] == '01-01':
-            sun_start = sun_o.altitudes.index[0]
-            moon_start = moon_o.altitudes.index[0]
-            tide_start = tide_o.all_tides.index[0]
+            sun_start = moon_start = tide_start = 0
         else:
-            sun_start = sun_o.altitudes[yesterday].index[-10]
-            moon_start = moon_o.altitudes[yesterday].index[-10]
-            tide_start = tide_o.all_tides[yesterday].index[-10]
-        
+            sun_start = sun_pos[day_index] - 10
+            moon_start = moon_pos[day_index] - 10
+            tide_start = tide_pos[day_index] - 10
+
         if date[5:] == '12-31':
-            sun_stop = sun_o.altitudes.index[-1]
-            moon_stop = moon_o.altitudes.index[-1]
-            tide_stop = tide_o.all_tides.index[-1]
+            # stop at the end of the month window, not the series - with
+            # extend_ends the tide series runs hours past year-end, beyond
+            # the precomputed x-arrays (and the axis xlim)
+            sun_stop = sun_end
+            moon_stop = moon_end
+            tide_stop = tide_end
         else:
-            sun_stop = sun_o.altitudes[tomorrow].index[10]
-            moon_stop = moon_o.altitudes[tomorrow].index[10]
-            tide_stop = tide_o.all_tides[tomorrow].index[10]
-        
-        day_of_sun = sun_o.altitudes[sun_start:sun_stop]
-        day_of_moon = moon_o.altitudes[moon_start:moon_stop]
-        day_of_tide = tide_o.all_tides[tide_start:tide_stop]
-        
-        # convert indices to matplotlib-friendly datetime format
-        Si = day_of_sun.index.to_pydatetime()
-        Mi = day_of_moon.index.to_pydatetime()
-        Ti = day_of_tide.index.to_pydatetime()
-        
-        # zeros for plotting the filled area under each curve
-        Sz = np.zeros(len(Si))
-        Mz = np.zeros(len(Mi))
-        Tz = np.zeros(len(Ti))
-        
-        # plot x-limits - need to be in matplotlib date number format
-        midnight0 = pd.to_datetime('{} 00:00'.format(date))
-        midnight0 = midnight0.tz_localize(tide_o.timezone).to_pydatetime()
-        midnight1 = pd.to_datetime('{} 00:00'.format(tomorrow))
-        midnight1 = midnight1.tz_localize(tide_o.timezone).to_pydatetime()
-        start_time = matplotlib.dates.date2num(midnight0)
-        stop_time = matplotlib.dates.date2num(midnight1)
-        
-        # sun and moon heights on top
-        ax1 = plt.subplot(gs[grid_index])
-        ax1.fill_between(Si, np.sin(day_of_sun), Sz, color = '#FFEB00',
-                         alpha = 0.25)  # the sunlight intensity
-        ax1.fill_between(Si, day_of_sun / (np.pi / 2), Sz, color = '#FFEB00',
-                         alpha = 1)  # the altitude angle
-        ax1.fill_between(Mi, day_of_moon / (np.pi / 2), Mz, color = '#D7A8A8',
-                         alpha = 0.25)
+            # + 11: ten samples into tomorrow, inclusive like label slicing
+            sun_stop = sun_pos[day_index + 1] + 11
+            moon_stop = moon_pos[day_index + 1] + 11
+            tide_stop = tide_pos[day_index + 1] + 11
+
+        day_sun_sin = sun_sin[sun_start - sun_base:sun_stop - sun_base]
+        day_sun_norm = sun_norm[sun_start - sun_base:sun_stop - sun_base]
+        day_moon_norm = moon_norm[
+                                  moon_start - moon_base:moon_stop - moon_base]
+        # tide interpolation (resolution 100 per half cycle) is far denser
+        # than an 8.5x11" PDF can resolve; every 4th sample is plenty
+        day_of_tide = tide_vals[tide_start:tide_stop:4]
+
+        # matplotlib-friendly coordinates, sliced from the month-level arrays
+        x_sun = sun_x[sun_start - sun_base:sun_stop - sun_base]
+        x_moon = moon_x[moon_start - moon_base:moon_stop - moon_base]
+        x_tide = tide_x[tide_start - tide_base:tide_stop - tide_base:4]
+
+        # plot x-limits - precomputed midnight boundaries for the month
+        start_time = edge_nums[day_index]
+        stop_time = edge_nums[day_index + 1]
+
+        # sun and moon heights on top; the three stacked fills go into one
+        # PolyCollection, and closing each curve back along the zero
+        # baseline by hand emits N+2 vertices per polygon where a
+        # fill_between call emits 2N
+        verts = []
+        for x, y in ((x_sun, day_sun_sin), (x_sun, day_sun_norm),
+                     (x_moon, day_moon_norm)):
+            poly = np.empty((len(x) + 2, 2))
+            poly[:len(x), 0] = x
+            poly[:len(x), 1] = y
+            poly[len(x)] = (x[-1], 0.0)
+            poly[len(x) + 1] = (x[0], 0.0)
+            verts.append(poly)
+        ax1 = fig.add_subplot(gs[grid_index])
+        ax1.add_collection(PolyCollection(verts,
+                                          facecolors = _DAY_FILL_COLORS,
+                                          edgecolors = 'none'))
         ax1.set_xlim((start_time, stop_time))
         ax1.set_ylim((0, 1))
         ax1.set_xticks([])
@@ -216,24 +338,24 @@ def month_page(month_string, tide_o, sun_o, moon_o):
             ax1.spines[side].set_linewidth(1.5)
         ax1.spines['bottom'].set_visible(False)
         # add date number
-        plt.text(0.05, 0.73, pd.to_datetime(date).day, ha = 'left',
-                 fontsize = 14, fontname='Alegreya',
+        ax1.text(0.05, 0.73, int(date[8:]), ha = 'left',
+                 fontsize = 14, fontproperties=_FONT_ALEGREYA,
                  transform = ax1.transAxes)
         # add moon phase icon
-        moon_icon = '0ABCDEFGHIJKLM@NOPQRSTUVWXYZ'  # the dark part
-        plt.text(0.96, 0.69, moon_icon[moon_o.phase_day_num[date]],
+        ax1.text(0.96, 0.69, _MOON_ICONS[phase_nums[day_index]],  # dark part
                  ha = 'right', fontsize = 12, color = '0.75',
-                 fontname = 'moon phases', transform = ax1.transAxes)
-        plt.text(0.96, 0.69, '*',   # the white part
+                 fontproperties = _FONT_MOON, transform = ax1.transAxes)
+        ax1.text(0.96, 0.69, '*',   # the white part
                  ha = 'right', fontsize = 12, color = '#D7A8A8', alpha = 0.25,
-                 fontname = 'moon phases', transform = ax1.transAxes)
-        plt.text(0.96, 0.69, '@',   # the outline
+                 fontproperties = _FONT_MOON, transform = ax1.transAxes)
+        ax1.text(0.96, 0.69, '@',   # the outline
                  ha = 'right', fontsize = 12, color = 'black',
-                 fontname = 'moon phases', transform = ax1.transAxes)
+                 fontproperties = _FONT_MOON, transform = ax1.transAxes)
         
         # tide magnitudes below
-        ax2 = plt.subplot(gs[grid_index + 7])
-        ax2.fill_between(Ti, day_of_tide, Tz, color = '#52ABB7', alpha = 0.8)
+        ax2 = fig.add_subplot(gs[grid_index + 7])
+        ax2.fill_between(x_tide, day_of_tide, 0, color = '#52ABB7',
+                         alpha = 0.8)
         ax2.set_xlim((start_time, stop_time))
         tide_margin = (tide_max - tide_min) / 60  # prevent overlap with spines
         ax2.set_ylim((tide_min - 1.5 * tide_margin, tide_max + tide_margin))
@@ -253,10 +375,10 @@ def month_page(month_string, tide_o, sun_o, moon_o):
     # dayofweek --> Monday=0, Sunday=6. Our week starts on Sunday.
     init_day = (pd.to_datetime(month_string + '-01').dayofweek + 1) % 7
     gridnum = init_day  # start daily plots on correct day of week
-    for day in days_in_month(month_string):
-        ax, _ = _plot_a_date(gridnum, day)
+    for day_index, day in enumerate(month_days):
+        ax, _ = _plot_a_date(gridnum, day_index, day)
         daily_axes.append(ax)
-        if pd.to_datetime(day).dayofweek == 5: # if just plotted a Saturday
+        if (init_day + day_index) % 7 == 6: # if just plotted a Saturday
             gridnum += 8  # skip down a full row to leave tide subplots intact
         else:
             gridnum += 1
@@ -265,19 +387,14 @@ def month_page(month_string, tide_o, sun_o, moon_o):
     fig.subplots_adjust(left = 0.05, right = 0.95, bottom = 0.1, top = 0.8,
                         hspace = 0.0, wspace = 0.0)
 
-    # add solstice or equinox icon, if needed this month
-    sun_icon_col = {
-        'spring equinox':   '#CCFFCC',
-        'summer solstice':  '#E2AAFF',
-        'fall equinox':     '#D56F28',
-        'winter solstice':  '#B4EAF4'
-    }
-    monthnum = pd.to_datetime(month_string).month
-    if monthnum in sun_o.events.index.month:
-        solar_event = sun_o.events[monthnum == sun_o.events.index.month]
-        xloc = matplotlib.dates.date2num(solar_event.index[0].to_pydatetime())
-        sol_color = sun_icon_col[solar_event[0]]
-        sol_ax = daily_axes[solar_event.index[0].day - 1]
+    # add solstice or equinox icon, if needed this month (at most one per
+    # month, so a dict lookup replaces two linear index scans)
+    solar_event = _events_by_month(sun_o.events).get(int(month_string[5:7]))
+    if solar_event is not None:
+        event_time, event_name = solar_event
+        xloc = matplotlib.dates.date2num(event_time.to_pydatetime())
+        sol_color = _SUN_ICON_COL[event_name]
+        sol_ax = daily_axes[event_time.day - 1]
         sol_ax.scatter(xloc, 0.25, s=400, marker = (16, 1, 0),
                        facecolor = sol_color, linewidth = 0.5,
                        edgecolor = 'black', zorder = 300, clip_on = False)
@@ -289,13 +406,13 @@ def month_page(month_string, tide_o, sun_o, moon_o):
     day_names = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday',
                  'Friday', 'Saturday']
     for i in range(init_day, 7):  # day-of-week labels on top row subplots
-        plt.text(0.5, 1.08, day_names[i],
+        daily_axes[i - init_day].text(0.5, 1.08, day_names[i],
                  horizontalalignment = 'center',
-                 fontsize = 12, fontname = 'Alegreya',
+                 fontsize = 12, fontproperties = _FONT_ALEGREYA,
                  transform = daily_axes[i - init_day].transAxes)
     for i in range(init_day):  # handle the blank boxes on top row
-        temp_ax = plt.subplot(gs[i])
-        temp2_ax = plt.subplot(gs[i + 7])
+        temp_ax = fig.add_subplot(gs[i])
+        temp2_ax = fig.add_subplot(gs[i + 7])
         temp_ax.set_xticks([])
         temp_ax.set_yticks([])
         temp2_ax.set_xticks([])
@@ -313,9 +430,9 @@ def month_page(month_string, tide_o, sun_o, moon_o):
         temp2_ax.spines['top'].set_linewidth(0.0)
         temp_ax.spines['top'].set_linewidth(1.5)
         temp2_ax.spines['bottom'].set_linewidth(1.5)
-        plt.text(0.5, 1.08, day_names[i],     # doy-of-week labels on blanks
+        temp_ax.text(0.5, 1.08, day_names[i],  # day-of-week labels on blanks
                      horizontalalignment = 'center',
-                     fontsize = 12, fontname = 'Alegreya',
+                     fontsize = 12, fontproperties = _FONT_ALEGREYA,
                      transform = temp_ax.transAxes)
 
     # title and footer text
@@ -327,20 +444,15 @@ def month_page(month_string, tide_o, sun_o, moon_o):
              fontsize = '16', fontname = 'Alegreya')
     fig.text(0.92, 0.13, 'Sun * Moon * Tide', horizontalalignment = 'right',
              fontsize = '36', fontname = 'FoglihtenNo01')
-    # cruzviz logo on footer
-    try:
-        logo = pkgutil.get_data('cal_draw', 'graphics/logo.png')
-        im = Image.open(BytesIO(logo))
-        im = np.array(im).astype(np.float) / 255
-        fig.figimage(im, xo = 505, yo = 70)
-    except Exception as e:
-        print('Could not load logo image. Error: ' + e)  # no exception raised
-    
+    # cruzviz logo on footer (decoded once at module import)
+    if _LOGO is not None:
+        fig.figimage(_LOGO, xo = 505, yo = 70)
+
     return fig
 
 
 def cover(tide):
-    """Returns a matplotlib.pyplot Figure object, ready to write to PDF.
+    """Returns a matplotlib Figure object, ready to write to PDF.
     """
     
     R = 2         # main circle radius
@@ -357,10 +469,15 @@ def cover(tide):
     moontheta = np.linspace(0, 2 * np.pi, 17)[:-1]
     o = 0.3      # offset for moon icons to account for right alignment
 
-    fig = plt.figure(figsize=(8.5,11))
-    ax = plt.subplot(111)
-    for frac in np.linspace(0, 1, 20):
-        ax.plot(frac * x, frac * y, '-',color = '#52ABB7', lw = 3, alpha = 0.5)
+    fig = Figure(figsize = (8.5, 11))
+    FigureCanvasPdf(fig)
+    ax = fig.add_subplot(111)
+    # all twenty concentric rings in one LineCollection rather than twenty
+    # separately registered and rendered Line2D artists
+    rings = [np.column_stack((frac * x, frac * y))
+             for frac in np.linspace(0, 1, 20)]
+    ax.add_collection(LineCollection(rings, colors = '#52ABB7',
+                                     linewidths = 3, alpha = 0.5))
     #ax.plot(4 * cos(theta), 4 * sin(theta), '--', c = 'red')  # moon placement check
     for daynum in range(16):
         th = moontheta[daynum]
@@ -368,13 +485,13 @@ def cover(tide):
         my = 2 * R * np.sin(th) - o
         # the dark part
         ax.text(mx, my, moon_icon[daynum], ha = 'right', fontsize = 12,
-                color = '0.75', fontname = 'moon phases')
+                color = '0.75', fontproperties = _FONT_MOON)
         # the white part
         ax.text(mx, my, '*', ha = 'right', fontsize = 12, 
-                color = '#D7A8A8', alpha = 0.25, fontname = 'moon phases')
+                color = '#D7A8A8', alpha = 0.25, fontproperties = _FONT_MOON)
         # the outline
         ax.text(mx, my, '@', ha = 'right', fontsize = 12,
-                color = 'black', fontname = 'moon phases', zorder = 20)
+                color = 'black', fontproperties = _FONT_MOON, zorder = 20)
 
 
     # the sun
@@ -403,9 +520,10 @@ def cover(tide):
 
 
 def yearview(tide_o, sun_o, moon_o):
-    """Returns a matplotlib.pyplot Figure object, ready to write to PDF.
+    """Returns a matplotlib Figure object, ready to write to PDF.
     """
-    fig = plt.figure(figsize=(8.5,11))
+    fig = Figure(figsize = (8.5, 11))
+    FigureCanvasPdf(fig)
     fig.text(0.5, 0.875, '{} Overview'.format(tide_o.year),
              horizontalalignment = 'center', fontsize = '48',
              fontname = 'Alegreya SC')
@@ -427,35 +545,55 @@ def yearview(tide_o, sun_o, moon_o):
     allmonths = list(months_in_year(tide_o.year))
     month_chunks = [allmonths[:3], allmonths[3:6], allmonths[6:9],
                     allmonths[9:]]
-    
+
+    # precompute integer slice positions of the month boundaries for the
+    # three series - partial-string month indexing re-parses the month and
+    # searches the full-year index on every lookup otherwise
+    month_edges = pd.date_range('{}-01-01'.format(tide_o.year), periods = 13,
+                                freq = 'MS', tz = tide_o.timezone)
+    sun_pos = sun_o.altitudes.index.searchsorted(month_edges)
+    moon_pos = moon_o.altitudes.index.searchsorted(month_edges)
+    tide_pos = tide_o.all_tides.index.searchsorted(month_edges)
+    # normalize the altitudes once for the whole year; the monthly slices
+    # below are disjoint, so this also keeps the plotted values as plain
+    # arrays instead of rebuilding a Series per subplot
+    sun_norm = sun_o.altitudes.values / (np.pi / 2)
+    moon_norm = moon_o.altitudes.values / (np.pi / 2)
+    tide_vals = tide_o.all_tides.values
+    # x-coordinates for the whole year as matplotlib date numbers, one
+    # vectorized conversion per series instead of one per subplot
+    sun_x = matplotlib.dates.date2num(sun_o.altitudes.index.to_pydatetime())
+    moon_x = matplotlib.dates.date2num(moon_o.altitudes.index.to_pydatetime())
+    tide_x = matplotlib.dates.date2num(tide_o.all_tides.index.to_pydatetime())
+    solar_events = _events_by_month(sun_o.events)
+
     for chunk, gsi in zip(month_chunks, gsx):
         for ind in [0, 1, 2]:
             month = chunk[ind]
-            month_of_sun = sun_o.altitudes[month]
-            month_of_moon = moon_o.altitudes[month]
-            month_of_tide = tide_o.all_tides[month]
-
-            # convert indices to matplotlib-friendly datetime format
-            Si = month_of_sun.index.to_pydatetime()
-            Mi = month_of_moon.index.to_pydatetime()
-            Ti = month_of_tide.index.to_pydatetime()
-
-            # zeros for plotting the filled area under each curve
-            Sz = np.zeros(len(Si))
-            Mz = np.zeros(len(Mi))
-            Tz = np.zeros(len(Ti))
+            m = int(month[5:7]) - 1  # zero-based month number
+            month_of_sun = sun_norm[sun_pos[m]:sun_pos[m + 1]]
+            month_of_moon = moon_norm[moon_pos[m]:moon_pos[m + 1]]
 
             # x-limits based on first and last tide interp time - for
-            # cases where only have one or two hi/lo tides per day 
+            # cases where only have one or two hi/lo tides per day
             # - no more odd cut offs near borders
-            start_time = matplotlib.dates.date2num(Ti[0])
-            stop_time = matplotlib.dates.date2num(Ti[-1])
+            start_time = tide_x[tide_pos[m]]
+            stop_time = tide_x[tide_pos[m + 1] - 1]
+
+            # thin the dense tide interpolation for plotting (the x-limits
+            # above come from the full slice, so borders stay anchored)
+            month_of_tide = tide_vals[tide_pos[m]:tide_pos[m + 1]:4]
+
+            # matplotlib-friendly x-coordinates for the month
+            Si = sun_x[sun_pos[m]:sun_pos[m + 1]]
+            Mi = moon_x[moon_pos[m]:moon_pos[m + 1]]
+            Ti = tide_x[tide_pos[m]:tide_pos[m + 1]:4]
 
             # sun and moon heights on top
-            ax1 = plt.subplot(gsi[ind])
-            ax1.fill_between(Si, month_of_sun / (np.pi / 2), Sz, 
+            ax1 = fig.add_subplot(gsi[ind])
+            ax1.fill_between(Si, month_of_sun, 0,
                              color = '#FFEB00', alpha = 1)  # altitude angle
-            ax1.fill_between(Mi, month_of_moon / (np.pi / 2), Mz, 
+            ax1.fill_between(Mi, month_of_moon, 0,
                              color = '#D7A8A8', alpha = 0.25)
             ax1.set_xlim((start_time, stop_time))
             ax1.set_ylim((0, 1))
@@ -468,63 +606,59 @@ def yearview(tide_o, sun_o, moon_o):
             # add full/new moon icon(s)
             luns = moon_o.half_phases[month]            
             if luns[luns == 'full'].any():
-                full_moon_times = luns[luns == 'full'].index.to_pydatetime()
+                full_moon_times = matplotlib.dates.date2num(
+                                  luns[luns == 'full'].index.to_pydatetime())
                 for moontime in full_moon_times:
                     ax1.text(moontime, 0.69, '@',   # the dark part
                          ha = 'left', fontsize = 12, color = '0.75',
-                         fontname = 'moon phases', zorder = 1400)
+                         fontproperties = _FONT_MOON, zorder = 1400)
                     ax1.text(moontime, 0.69, '*',   # the white part
                          ha = 'left', fontsize = 12, color = '#D7A8A8',
-                         alpha = 0.25, fontname = 'moon phases',
+                         alpha = 0.25, fontproperties = _FONT_MOON,
                          zorder = 1410)
                     ax1.text(moontime, 0.69, '@',   # the outline
                              ha = 'left', fontsize = 12, color = 'black',
-                             fontname = 'moon phases', zorder = 1520)
+                             fontproperties = _FONT_MOON, zorder = 1520)
 
             if luns[luns == 'new'].any():
-                new_moon_times = luns[luns == 'new'].index.to_pydatetime()
+                new_moon_times = matplotlib.dates.date2num(
+                                  luns[luns == 'new'].index.to_pydatetime())
                 for moontime in new_moon_times:
                     ax1.text(moontime, 0.69, '0',   # the dark part
                              ha = 'left', fontsize = 12, color = '0.75',
-                             fontname = 'moon phases', zorder = 1500)
+                             fontproperties = _FONT_MOON, zorder = 1500)
                     ax1.text(moontime, 0.69, '*',   # the white part
                              ha = 'left', fontsize = 12, color = '#D7A8A8',
-                             alpha = 0.25, fontname = 'moon phases',
+                             alpha = 0.25, fontproperties = _FONT_MOON,
                              zorder = 1510)
                     ax1.text(moontime, 0.69, '@',   # the outline
                              ha = 'left', fontsize = 12, color = 'black',
-                             fontname = 'moon phases', zorder = 1520)
+                             fontproperties = _FONT_MOON, zorder = 1520)
 
 
             if luns.index[-1].day > 25:
                 ax1.set_zorder(10000 - luns.index[-1].month)
             
             # add solstice or equinox icon, if needed this month
-            sun_icon_col = {
-                'spring equinox':   '#CCFFCC',
-                'summer solstice':  '#E2AAFF',
-                'fall equinox':     '#D56F28',
-                'winter solstice':  '#B4EAF4'
-            }
-            monthnum = pd.to_datetime(month).month
-            if monthnum in sun_o.events.index.month:
-                solar_event = sun_o.events[monthnum == sun_o.events.index.month]
-                xloc = matplotlib.dates.date2num(solar_event.index[0].to_pydatetime())
-                sol_color = sun_icon_col[solar_event[0]]
+            solar_event = solar_events.get(m + 1)
+            if solar_event is not None:
+                event_time, event_name = solar_event
+                xloc = matplotlib.dates.date2num(event_time.to_pydatetime())
+                sol_color = _SUN_ICON_COL[event_name]
                 ax1.scatter(xloc, 0.25, s=400, marker = (16, 1, 0),
                                facecolor = sol_color, linewidth = 0.5,
                                edgecolor = 'black', zorder = 300, 
                                clip_on = False)
 
             # add month name to top of the box
-            month_name = pd.to_datetime(month).strftime('%B')
-            plt.text(0.5, 1.08, month_name, horizontalalignment = 'center',
-                 fontsize = 12, fontname = 'Alegreya', 
+            month_name = calendar.month_name[m + 1]
+            ax1.text(0.5, 1.08, month_name, horizontalalignment = 'center',
+                 fontsize = 12, fontproperties = _FONT_ALEGREYA, 
                  transform = ax1.transAxes)
                 
             # tide magnitudes below
-            ax2 = plt.subplot(gsi[ind + 3])
-            ax2.fill_between(Ti, month_of_tide, Tz, 
+            ax2 = fig.add_subplot(gsi[ind + 3])
+            ax2.fill_between(Ti, month_of_tide, 0, 
                              color = '#52ABB7', alpha = 0.8)
             ax2.set_xlim((start_time, stop_time))
             tide_margin = (tide_o.annual_max - tide_o.annual_min) / 60
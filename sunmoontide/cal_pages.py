@@ -8,15 +8,29 @@ templates and WeasyPrint instead of matplotlib.
 from io import BytesIO
 import pkgutil
 from string import Template
-import weasyprint
+
+# package data (HTML templates and graphics) cached by resource path -
+# the url fetcher runs once per <img> tag and pkgutil re-walks the
+# package finders on every call otherwise
+_DATA_CACHE = {}
+
+
+def _get_data(resource):
+    if resource not in _DATA_CACHE:
+        _DATA_CACHE[resource] = pkgutil.get_data('cal_pages', resource)
+    return _DATA_CACHE[resource]
 
 
 def about(st_name):
-    """Creates a one-page PDF for the About page in the current working
-    directory, and returns its filename.
+    """Renders the one-page About PDF and returns it as bytes, ready to
+    merge - no temporary file touches disk.
     """
+    # deferred: weasyprint pulls in its whole CSS/font stack at import
+    # time, which callers that never render the info pages shouldn't pay
+    import weasyprint
+
     try:
-        abouthtml = pkgutil.get_data('cal_pages', 'infopages/about.html')
+        abouthtml = _get_data('infopages/about.html')
     except Exception as e:
         print('Could not find the HTML template for the About the Calendar \
 page. Expected: sunmoontide/infopages/about.html')
@@ -29,7 +43,7 @@ page. Expected: sunmoontide/infopages/about.html')
         """
         if url.startswith('graph:'):
             try:
-                g = pkgutil.get_data('cal_pages', 'graphics/{}'.format(url[6:]))
+                g = _get_data('graphics/{}'.format(url[6:]))
             except Exception as e:
                 print('Could not find a graphic for the About the Calendar \
     page. Expected: sunmoontide/graphics/{}'.format(url[6:]))
@@ -51,14 +65,13 @@ page. Expected: sunmoontide/infopages/about.html')
 
     abouttemplate = Template(BytesIO(abouthtml).read().decode('utf-8'))
     abouthtml = abouttemplate.substitute(st_name = st_name)
-    weasyprint.HTML(string = abouthtml,
-         url_fetcher = _my_fetcher).write_pdf('about_tmp.pdf')
-    return 'about_tmp.pdf'
+    return weasyprint.HTML(string = abouthtml,
+         url_fetcher = _my_fetcher).write_pdf()
 
 
 def tech(tide):
-    """Creates a multi-page PDF for the Technical Details section in the
-    current working directory, and returns its filename.
+    """Renders the multi-page Technical Details PDF and returns it as
+    bytes, ready to merge - no temporary file touches disk.
     """
     if tide.station_type == 'subordinate' and tide.height_offset_low > 50:
         optstring = 'The predictions are referenced to {0.ref_station_name} \
@@ -76,9 +89,11 @@ station high and low times by {0.time_offset_high} and {0.time_offset_low} \
 minutes, respectively.</p>'.format(tide)
     else:
         optstring = '</p>'
-    
+
+    import weasyprint  # deferred, same as in about()
+
     try:
-        techhtml = pkgutil.get_data('cal_pages', 'infopages/tech.html')
+        techhtml = _get_data('infopages/tech.html')
     except Exception as e:
         print('Could not find the HTML template for the Technical Details \
 section. Expected: sunmoontide/infopages/tech.html')
@@ -93,5 +108,4 @@ section. Expected: sunmoontide/infopages/tech.html')
 
     techtemplate = Template(BytesIO(techhtml).read().decode('utf-8'))
     techhtml = techtemplate.substitute(argdict)
-    weasyprint.HTML(string = techhtml).write_pdf('tech_tmp.pdf')
-    return 'tech_tmp.pdf'
+    return weasyprint.HTML(string = techhtml).write_pdf()
@@ -5,18 +5,27 @@ Search for `&**&` to find code segments that assume a certain format for the
 NOAA text file input. Last updated 7/24/2015 by Sara Hendrix.
 """
 
-import itertools
+import functools
 import numpy as np
 import math
 import pandas as pd
 import pkgutil
-from io import BytesIO
-
-def pairwise(iterable):
-    "s -> (s0,s1), (s1,s2), (s2, s3), ..."
-    a, b = itertools.tee(iterable)
-    next(b, None)
-    return zip(a, b)
+from io import BytesIO, StringIO
+
+@functools.lru_cache(maxsize = None)
+def _sin_kernel(resolution, dtype = np.float64):
+    """Unit sine kernels for one trough-to-peak and one peak-to-trough
+    interval at the given resolution and dtype. The kernels depend only on
+    those two arguments, so they are computed once and cached; the arrays
+    are marked read-only because every caller shares them.
+    """
+    k_up = np.sin(np.linspace(-math.pi / 2., math.pi / 2., resolution,
+                              dtype = dtype))
+    k_dn = np.sin(np.linspace(math.pi / 2., (3. / 2.) * math.pi, resolution,
+                              dtype = dtype))
+    k_up.setflags(write = False)
+    k_dn.setflags(write = False)
+    return k_up, k_dn
 
 
 def sine_interp(height1, height2, resolution, remove_end=False):
@@ -60,7 +69,13 @@ def sine_interp(height1, height2, resolution, remove_end=False):
     h2 = float(height2)
     assert(type(resolution) is int)
     assert(resolution > 2)
-    
+
+    if h1 == h2:
+        # flat line - no sine to evaluate
+        if remove_end == True:
+            return np.full(resolution - 1, h1)
+        return np.full(resolution, h1)
+
     amp = (max(h1, h2) - min(h1, h2)) / 2.  # amplitude
     bump = max(h1, h2) - amp                # vertical offset
 
@@ -115,18 +130,27 @@ def read_noaa_header(filename):
     ['Date', 'Day', 'Time', 'Pred(Ft)', 'Pred(cm)', 'High/Low']
 
     """
-    metadata = {}
     with open(filename, 'r') as file:
-        for line in file:
-            if line.isspace():
-                    break
-            elif line.find(': ') >= 0:
-                k, v = line.split(': ')
-            else:
-                k = line
-                v = ''
-            metadata[k] = v
-        column_names = file.readline()
+        return _parse_noaa_header(file.read(), filename)
+
+
+def _parse_noaa_header(text, filename):
+    """The working half of `read_noaa_header`, operating on the file's text
+    so callers that already hold the contents (like Tides, which also feeds
+    them to read_csv) don't read the file twice. `filename` only labels
+    error messages.
+    """
+    metadata = {}
+    # keepends so keys and values stay exactly as read from the file,
+    # newlines included
+    lines = iter(text.splitlines(keepends = True))
+    for line in lines:
+        if line.isspace():
+            break
+        # partition leaves k = whole line, v = '' when ': ' is absent
+        k, _, v = line.partition(': ')
+        metadata[k] = v
+    column_names = next(lines, '')
     
     def _check_that(Boolean_valued_statement):
         """If `Boolean_valued_statement` is False, raise a detailed error."""
@@ -150,6 +174,22 @@ for an example of the expected file format.'.format(filename))
     return metadata, column_names
 
 
+@functools.lru_cache(maxsize = None)
+def _station_table():
+    """Load and parse station_info.csv once; every station lookup (the home
+    station plus any reference station) shares the cached DataFrame.
+    """
+    try:
+        lookup = pkgutil.get_data('tides', 'station_info.csv')
+    except Exception as e:
+        error_message = (
+'In Tides, lookup_station_info could not find its lookup file, \
+station_info.csv. Error: {}'.format(e))
+        raise IOError(error_message)
+
+    return pd.read_csv(BytesIO(lookup), index_col=0)
+
+
 def lookup_station_info(StationID):
     """ Given a NOAA tide prediction station ID, look it up in
     station_info.csv and return the information in a dict.
@@ -177,15 +217,7 @@ def lookup_station_info(StationID):
     >>> info['timezone']
     'US/Central'
 """
-    try:
-        lookup = pkgutil.get_data('tides', 'station_info.csv')
-    except Exception as e:
-        error_message = (
-'In Tides, lookup_station_info could not find its lookup file, \
-station_info.csv. Error: {}'.format(e))
-        raise IOError(error_message)
-
-    all_data = pd.read_csv(BytesIO(lookup), index_col=0)
+    all_data = _station_table()
     try:
         station_data = all_data.loc[StationID]
     except Exception as e:
@@ -206,7 +238,8 @@ station_info.csv.'.format(StationID, e))
     return info
 
 
-def build_all_tides(raw_tides, resolution, use_column, extend_ends=False):
+def build_all_tides(raw_tides, resolution, use_column, extend_ends=False,
+                    out_dtype=np.float64):
     """ Interpolate tide magnitudes and timestamps from given highs/lows.
     
     Args:
@@ -226,69 +259,81 @@ def build_all_tides(raw_tides, resolution, use_column, extend_ends=False):
             an odd visual cut off in the first hours of Jan 1 when raw_tides
             begins after midnight, and also in the last hours of Dec 31 when
             raw_tides ends before midnight.
+        out_dtype: numpy dtype for the interpolated heights. The calendar
+            passes float32 - plotting gains nothing from float64 and the
+            year-long series takes half the memory.
 
     Returns:
         all_tides: a pandas timeseries of sine interpolated tides,
                    with datetime index localized to UTC.
     """
-    assert(raw_tides.index.tzinfo.zone == 'UTC')    
+    # str() of the tz works for both pytz and datetime.timezone, which
+    # newer pandas returns for UTC and which has no .zone attribute
+    assert(str(raw_tides.index.tz) == 'UTC')
     assert(type(resolution) is int)
     assert(resolution > 2)
     
-    raw_values = eval('raw_tides.' + use_column)
+    v = raw_tides[use_column].values
     alltides = []
     tidetimes = []
-    
+
     if extend_ends:
         # interpolate from second tide height to first tide height
-        initial_interps = sine_interp(raw_values[1], raw_values[0],
-                                      resolution, True)
+        initial_interps = sine_interp(v[1], v[0], resolution, True)
         alltides.append(initial_interps)
         # start 7 hours before first tide extreme
-        a = np.datetime64(raw_tides.index[0]) - np.timedelta64(7, 'h')
-        b = np.datetime64(raw_tides.index[0])
+        b = raw_tides.index.values[0]
+        a = b - np.timedelta64(7, 'h')
         step = np.timedelta64((b - a) / (resolution - 1))
         initial_times = np.arange(a, b, step)
         initial_times = initial_times[:resolution - 1]
         tidetimes.append(initial_times)
         
     
-    for value_a, value_b in pairwise(raw_values):
-        interps = sine_interp(value_a, value_b, resolution, True)
-        assert(len(interps) == (resolution - 1))
-        alltides.append(interps)
-    alltides = np.array(alltides).flatten()
-    # add on the last tide value, left out of the loop
-    alltides = np.append(alltides, raw_values[-1])
-
-    # create datetime index for alltides, with even spacing between each 
-    # subsequent high/low time from the raw_tides datetime index.    
-    for time_a, time_b in pairwise(raw_tides.index):
-        a = np.datetime64(time_a)
-        b = np.datetime64(time_b)
-        step = np.timedelta64((b - a) / (resolution-1))
-        interv = np.arange(a, b, step)
-        # assure proper length of time interval
-        interv = interv[:resolution-1]
-        assert(len(interv) == (resolution - 1))
-        tidetimes.append(interv)
-    tidetimes = np.array(tidetimes, dtype = 'datetime64[us]').flatten()
-    # add on the last datetime, left out of the loop
-    last_one = np.datetime64(raw_tides.index[-1])
-    assert(np.dtype(tidetimes[1]) == np.dtype(last_one))
-    tidetimes = np.append(tidetimes, last_one)
-    
+    # interpolate all interior intervals in one broadcast: every interval is
+    # the same quarter-wave sine kernel scaled by that interval's amplitude
+    # and vertical offset (exactly the arithmetic sine_interp does per pair)
+    value_a, value_b = v[:-1], v[1:]
+    amp = np.abs(value_b - value_a) / 2.          # amplitude per interval
+    bump = np.maximum(value_a, value_b) - amp     # vertical offset
+    amp = amp.astype(out_dtype, copy = False)
+    bump = bump.astype(out_dtype, copy = False)
+    k_up, k_dn = _sin_kernel(resolution, out_dtype)
+    kernel = np.where((value_a < value_b)[:, None],
+                      k_up[:resolution - 1], k_dn[:resolution - 1])
+    alltides.append((amp[:, None] * kernel + bump[:, None]).ravel())
+    # add on the last tide value, left out of the broadcast
+    alltides.append(v[-1:])
+
+    # create datetime index for alltides, with even spacing between each
+    # subsequent high/low time from the raw_tides datetime index. Integer
+    # nanosecond views let one broadcast replace a per-pair np.arange: each
+    # interval is start + step * [0 .. resolution-2], with step the
+    # truncated interval width / (resolution - 1). Staying at pandas'
+    # native ns unit avoids a round trip through datetime64[us].
+    times = raw_tides.index.values.view('i8')
+    starts = times[:-1]
+    steps = (times[1:] - starts) // (resolution - 1)
+    interv = starts[:, None] + steps[:, None] * np.arange(resolution - 1)
+    tidetimes.append(interv.ravel().view('datetime64[ns]'))
+    # add on the last datetime, left out of the broadcast
+    tidetimes.append(times[-1:].view('datetime64[ns]'))
+
     if extend_ends:
         # interpolate from last tide height to next-to-last tide height
-        interps = sine_interp(raw_values[-1], raw_values[-2], resolution, False)
-        alltides = np.append(alltides, interps)
+        interps = sine_interp(v[-1], v[-2], resolution, False)
+        alltides.append(interps)
         # start 10 seconds after last tide extreme
-        a = np.datetime64(raw_tides.index[-1]) + np.timedelta64(10, 's')
+        a = raw_tides.index.values[-1] + np.timedelta64(10, 's')
         b = a + np.timedelta64(7, 'h')  # 7 hours later
         step = np.timedelta64((b - a) / (resolution-1))
-        interv = np.arange(a, b, step)
-        tidetimes = np.append(tidetimes, interv)
+        tidetimes.append(np.arange(a, b, step))
 
+    # assemble each series with a single concatenate - repeated np.append
+    # copies the whole accumulated array every call. The small end pieces
+    # come out of sine_interp as float64, so settle the dtype here.
+    alltides = np.concatenate(alltides).astype(out_dtype, copy = False)
+    tidetimes = np.concatenate(tidetimes)
     assert(len(tidetimes)==len(alltides))
     all_tides = pd.Series(alltides,tidetimes)
     all_tides.index = all_tides.index.tz_localize('UTC')
@@ -306,7 +351,10 @@ class Tides:
         After this is done, all attributes are set and everything is ready for
         plotting and queries.
         """
-        metadata, col_names = read_noaa_header(NOAA_filename)
+        # read the file once - the header parser and read_csv below share it
+        with open(NOAA_filename, 'r') as file:
+            raw_text = file.read()
+        metadata, col_names = _parse_noaa_header(raw_text, NOAA_filename)
         self.station_id = metadata['Stationid'].strip() # &**& format dependant
         info = lookup_station_info(self.station_id)
         self.station_name = info['name']
@@ -320,33 +368,52 @@ class Tides:
         
 # ------------ Read annual tide table into pandas DataFrame--------------
 # NOTE: &**& format dependant ... main high/low data column name = 'ft'
-        rawtides = pd.read_csv(NOAA_filename,
-                       names = ['Date', 'Day', 'Time', 'AM/PM', 
+        rawtides = pd.read_csv(StringIO(raw_text),
+                       names = ['Date', 'Day', 'Time', 'AM/PM',
                                 'ft', 'cm', 'High/Low'],
-                       delim_whitespace = 1, skiprows = num_rows_to_skip,
-                       parse_dates = {'TimeIndex' :
-                                        ['Date', 'Day', 'Time', 'AM/PM']},
-                       index_col=0)
-        del rawtides['High/Low']
-        del rawtides['cm']
+                       delim_whitespace = 1, skiprows = num_rows_to_skip)
+        # build the index with an explicit format string - the parse_dates
+        # machinery falls back to inferring the format row by row
+        rawtides.index = pd.to_datetime(
+                rawtides['Date'] + ' ' + rawtides['Time']
+                + ' ' + rawtides['AM/PM'],
+                format = '%Y/%m/%d %I:%M %p')  # &**& format dependant
+        rawtides.index.name = 'TimeIndex'
+        for extra in ('Date', 'Day', 'Time', 'AM/PM', 'cm', 'High/Low'):
+            del rawtides[extra]
         # localize datetime index, assume ambiguous times are non-DST
         rawtides.index = rawtides.index.tz_localize(self.timezone,
                 ambiguous = np.zeros(len(rawtides), dtype = bool))
-        # convert to UTC for calculations        
-        rawtides.index = rawtides.index.tz_convert('UTC')
-        self.all_tides = build_all_tides(rawtides, resolution, 'ft',
-                                         extend_ends = True) # &**& 'ft'
-        self.all_tides.index = self.all_tides.index.tz_convert(self.timezone)
-        # back to local time, ready for plotting        
-        rawtides.index = rawtides.index.tz_convert(self.timezone)
         self.raw_tides = rawtides
+        # the interpolated series is built on first access - see all_tides
+        self._resolution = resolution
+        self._all_tides = None
 
         if self.station_type == 'subordinate':
             self._set_reference_station_info(metadata)
 
         self.year = str(self.raw_tides.index[100].year)
-        self.annual_max = max(rawtides.ft)     # &**& 'ft'
-        self.annual_min = min(rawtides.ft)     # &**& 'ft'
+        ft = rawtides['ft'].values             # &**& 'ft'
+        self.annual_max = ft.max()
+        self.annual_min = ft.min()
+
+    @property
+    def all_tides(self):
+        """The sine-interpolated tide series in local time, interpolated on
+        first access and cached on the instance - a Tides object used only
+        for station information never pays for the interpolation.
+        """
+        if self._all_tides is None:
+            # interpolate in UTC, serve in local time
+            raw_utc = self.raw_tides.tz_convert('UTC')
+            # float32 heights, matching the astro altitude series - plenty
+            # of precision for plotting at half the memory
+            all_tides = build_all_tides(raw_utc, self._resolution, 'ft',
+                                        extend_ends = True,
+                                        out_dtype = np.float32) # &**& 'ft'
+            all_tides.index = all_tides.index.tz_convert(self.timezone)
+            self._all_tides = all_tides
+        return self._all_tides
 
     def _set_reference_station_info(self,metadata):
         """Set attributes for reference station information, if station type
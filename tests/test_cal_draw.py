@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""Regression test for the December month page. Dec 31 is the only day
+whose plot slices run to the end of the month window, and with
+extend_ends = True the tide series continues hours past year-end - the
+December page must still slice x and y coordinates to matching lengths.
+"""
+from io import BytesIO
+import os
+import sys
+
+_REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_REPO_DIR, 'sunmoontide'))
+
+from astro import Astro
+from tides import Tides
+import cal_draw
+
+EXAMPLE_FILE = os.path.join(_REPO_DIR, 'example_noaa_file.TXT')
+
+
+def test_december_month_page_renders():
+    tide = Tides(EXAMPLE_FILE)
+    sun = Astro(float(tide.latitude), float(tide.longitude), tide.timezone,
+                int(tide.year), 'Sun')
+    moon = Astro(float(tide.latitude), float(tide.longitude), tide.timezone,
+                 int(tide.year), 'Moon')
+    fig = cal_draw.month_page('{}-12'.format(tide.year), tide, sun, moon)
+    buffer = BytesIO()
+    fig.savefig(buffer, format = 'pdf')
+    assert buffer.getvalue()[:5] == b'%PDF-'